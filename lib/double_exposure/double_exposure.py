@@ -1,3 +1,6 @@
+import cv2
+import numpy as np
+from numpy.typing import NDArray
 from PIL import Image
 
 
@@ -21,3 +24,34 @@ def double_exposure(img1: Image, img2: Image, alpha: float = 0.5) -> Image:
     blended = Image.blend(img1, img2, alpha)
 
     return blended
+
+
+def blend_arrays(array1: NDArray[np.uint8], array2: NDArray[np.uint8], alpha: float = 0.5) -> NDArray[np.uint8]:
+    """
+    Blend two RGB arrays of the same size like Image.blend, so parts of an image can be blended separately
+
+    :param array1: the first image as an array
+    :param array2: the second image as an array
+    :param alpha: the weight of the second image
+    :return: the blended array
+    """
+    # Fixed point with 8 fractional bits: 255 * 256 still fits in 16 bits, so the
+    # blend moves half the bytes of a float32 one.  Within 1 of Image.blend
+    weight = np.uint16(round(alpha * 256))
+    blended = np.multiply(array2, weight, dtype=np.uint16)
+    blended += np.multiply(array1, np.uint16(256) - weight, dtype=np.uint16)
+    blended >>= 8
+    return blended.astype(np.uint8)
+
+
+def blend_arrays_opencl(array1: NDArray[np.uint8], array2: NDArray[np.uint8], alpha: float = 0.5) -> NDArray[np.uint8]:
+    """
+    Blend two RGB arrays of the same size through OpenCV's transparent API, on a GPU when one is available
+
+    :param array1: the first image as an array
+    :param array2: the second image as an array
+    :param alpha: the weight of the second image
+    :return: the blended array, within 1 of Image.blend
+    """
+    blended = cv2.addWeighted(cv2.UMat(array1), 1 - alpha, cv2.UMat(array2), alpha, 0)
+    return blended.get()
@@ -1,8 +1,9 @@
 import unittest
 
+import numpy as np
 from PIL import Image
 
-from .double_exposure import double_exposure
+from .double_exposure import blend_arrays, blend_arrays_opencl, double_exposure
 
 
 class DoubleExposureTestCase(unittest.TestCase):
@@ -65,3 +66,33 @@ class DoubleExposureTestCase(unittest.TestCase):
 
         # Check if the result image matches the second image
         self.assertEqual(result_image, image2)
+
+    def test_blend_arrays_matches_image_blend(self) -> None:
+        """
+        Test that blending arrays gives the pixels of blending the images with PIL, up to fixed point rounding.
+
+        :return: None
+        """
+        rng = np.random.default_rng(0)
+        array1 = rng.integers(0, 256, (50, 70, 3), dtype=np.uint8)
+        array2 = rng.integers(0, 256, (50, 70, 3), dtype=np.uint8)
+        for alpha in (0.0, 0.05, 0.35, 0.5, 0.85, 1.0):
+            expected = Image.blend(Image.fromarray(array1), Image.fromarray(array2), alpha)
+            blended = blend_arrays(array1, array2, alpha)
+            np.testing.assert_allclose(blended, np.asarray(expected), atol=1, err_msg=alpha)
+        np.testing.assert_array_equal(blend_arrays(array1, array2, 0.0), array1)
+        np.testing.assert_array_equal(blend_arrays(array1, array2, 1.0), array2)
+
+    def test_blend_arrays_opencl_matches_cpu(self) -> None:
+        """
+        Test that blending through OpenCL, or its CPU fallback, gives the pixels of the CPU blend up to rounding.
+
+        :return: None
+        """
+        rng = np.random.default_rng(0)
+        array1 = rng.integers(0, 256, (50, 70, 3), dtype=np.uint8)
+        array2 = rng.integers(0, 256, (50, 70, 3), dtype=np.uint8)
+        for alpha in (0.0, 0.35, 1.0):
+            blended = blend_arrays_opencl(array1, array2, alpha)
+            self.assertEqual(blended.shape, array1.shape)
+            np.testing.assert_allclose(blended, blend_arrays(array1, array2, alpha), atol=1, err_msg=alpha)
@@ -1,14 +1,23 @@
+import inspect
 import math
+import os
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from typing import Callable, Iterable
+from functools import lru_cache
+from typing import Any, Callable, Hashable, Iterable, Sequence
 
+import cv2
 import numpy as np
 from numpy.typing import NDArray
 from PIL import Image
 
 np.seterr(divide="ignore", invalid="ignore")
 
+# NumPy releases the GIL in its ufuncs, so effects run on stripes in parallel
+_STRIPE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+_MIN_STRIPE_ROWS = 64
+
 
 class PIXEL_INTERPOLATION_METHOD(Enum):
     """
@@ -20,6 +29,7 @@ class PIXEL_INTERPOLATION_METHOD(Enum):
     """
 
     INTEGER = auto()
+    LINEAR = auto()
 
 
 class OFF_CANVAS_FILL(Enum):
@@ -30,12 +40,77 @@ class OFF_CANVAS_FILL(Enum):
     EDGE = auto()
 
 
+class REMAP_BACKEND(Enum):
+    """
+    Devices the final pixel remap can run on
+
+    OPENCL runs the remap through OpenCV's transparent API on a GPU when one is
+    available, and falls back to the CPU otherwise.
+    """
+
+    CPU = auto()
+    OPENCL = auto()
+
+
+_CV2_INTERPOLATION = {
+    PIXEL_INTERPOLATION_METHOD.INTEGER: cv2.INTER_NEAREST,
+    PIXEL_INTERPOLATION_METHOD.LINEAR: cv2.INTER_LINEAR,
+}
+_CV2_BORDER = {
+    OFF_CANVAS_FILL.WRAP: cv2.BORDER_WRAP,
+    OFF_CANVAS_FILL.MIRROR: cv2.BORDER_REFLECT,
+    OFF_CANVAS_FILL.EDGE: cv2.BORDER_REPLICATE,
+}
+
+
+def _fitting(buffer: NDArray | None, mesh: NDArray) -> NDArray | None:
+    """
+    Pick an output buffer for an operation on a mesh, if the buffer has the mesh's shape
+
+    :param buffer: the output buffer, if any
+    :param mesh: a mesh grid
+    :return: the buffer, or None to allocate a new array
+    """
+    if buffer is not None and buffer.shape == mesh.shape:
+        return buffer
+    return None
+
+
+def _add_mesh(offset: NDArray, mesh: NDArray, out: NDArray | None = None) -> NDArray:
+    """
+    Add a mesh to an offset, in place unless broadcasting the two needs a larger array
+
+    :param offset: the offset, which may be overwritten
+    :param mesh: a mesh grid
+    :param out: a buffer for the displaced mesh, instead of the offset or a new array
+    :return: the displaced mesh
+    """
+    if out is not None:
+        return np.add(offset, mesh, out=out)
+    if offset.shape == np.broadcast_shapes(offset.shape, mesh.shape):
+        offset += mesh
+        return offset
+    return offset + mesh
+
+
 class Effect:
-    """List of effects that all take xmesh, ymesh, and magnitude of the effect"""
+    """
+    List of effects that all take xmesh, ymesh, and magnitude of the effect
+
+    An effect with a magnitude of 0 must return the meshes unchanged, which lets
+    the MotionTransformer skip it.  Effects also accept the shape of the whole
+    canvas, so they can be applied to horizontal stripes of the meshes, and a
+    pair of full size buffers to write the meshes they move into.
+    """
 
     @staticmethod
     def vertical_wave(
-        xmesh: NDArray, ymesh: NDArray, magnitude: float = 1, wavenum: float = 1.5
+        xmesh: NDArray,
+        ymesh: NDArray,
+        magnitude: float = 1,
+        wavenum: float = 1.5,
+        shape: tuple[int, int] | None = None,
+        out: tuple[NDArray, NDArray] | None = None,
     ) -> tuple[NDArray, NDArray]:
         """
         Add vertical waves to Image
@@ -44,15 +119,27 @@ class Effect:
         :param ymesh: a mesh grid for y-axis
         :param magnitude: the magnitude for vertical waves
         :param wavenum: number of waves
+        :param shape: the height and width of the whole canvas, if the meshes only cover part of it
+        :param out: buffers for the displaced xmesh and ymesh, instead of new arrays
         :return: xmesh, ymesh
         """
-        height, width = xmesh.shape
-        offset = np.sin(xmesh / width * math.pi * 2 * wavenum) * magnitude * height / 4
-        return xmesh, ymesh + offset
+        height, width = shape or np.broadcast_shapes(xmesh.shape, ymesh.shape)
+        # One buffer holds the phase, the wave and finally the displaced mesh
+        target = None if out is None else out[1]
+        displaced = np.multiply(xmesh, math.pi * 2 * wavenum / width, out=_fitting(target, xmesh))
+        np.sin(displaced, out=displaced)
+        displaced *= magnitude * height / 4
+        displaced = _add_mesh(displaced, ymesh, out=target)
+        return xmesh, displaced
 
     @staticmethod
     def horizontal_wave(
-        xmesh: NDArray, ymesh: NDArray, magnitude: float = 1, wavenum: float = 1.5
+        xmesh: NDArray,
+        ymesh: NDArray,
+        magnitude: float = 1,
+        wavenum: float = 1.5,
+        shape: tuple[int, int] | None = None,
+        out: tuple[NDArray, NDArray] | None = None,
     ) -> tuple[NDArray, NDArray]:
         """
         Add horizontal waves to Image
@@ -61,15 +148,27 @@ class Effect:
         :param ymesh: a mesh grid for y-axis
         :param magnitude: the magnitude for horizontal waves
         :param wavenum: number of waves
+        :param shape: the height and width of the whole canvas, if the meshes only cover part of it
+        :param out: buffers for the displaced xmesh and ymesh, instead of new arrays
         :return: xmesh, ymesh
         """
-        height, width = xmesh.shape
-        offset = np.sin(ymesh / height * math.pi * 2 * wavenum) * magnitude * width / 4
-        return xmesh + offset, ymesh
+        height, width = shape or np.broadcast_shapes(xmesh.shape, ymesh.shape)
+        # One buffer holds the phase, the wave and finally the displaced mesh
+        target = None if out is None else out[0]
+        displaced = np.multiply(ymesh, math.pi * 2 * wavenum / height, out=_fitting(target, ymesh))
+        np.sin(displaced, out=displaced)
+        displaced *= magnitude * width / 4
+        displaced = _add_mesh(displaced, xmesh, out=target)
+        return displaced, ymesh
 
     @staticmethod
     def vertical_spike(
-        xmesh: NDArray, ymesh: NDArray, magnitude: float = 1, spikenum: float = 5
+        xmesh: NDArray,
+        ymesh: NDArray,
+        magnitude: float = 1,
+        spikenum: float = 5,
+        shape: tuple[int, int] | None = None,
+        out: tuple[NDArray, NDArray] | None = None,
     ) -> tuple[NDArray, NDArray]:
         """
         Add vertical spikes to Image
@@ -78,16 +177,33 @@ class Effect:
         :param ymesh: a mesh grid for y-axis
         :param magnitude: the magnitude for vertical spikes
         :param spikenum: number of spikes
+        :param shape: the height and width of the whole canvas, if the meshes only cover part of it
+        :param out: buffers for the displaced xmesh and ymesh, instead of new arrays
         :return: xmesh, ymesh
         """
-        _, width = xmesh.shape
+        _, width = shape or np.broadcast_shapes(xmesh.shape, ymesh.shape)
         spike_distance = width // spikenum
-        offset = np.abs(xmesh % spike_distance - spike_distance // 2) * magnitude * 2
-        return xmesh, ymesh + offset
+        # xmesh % spike_distance as xmesh - floor(xmesh / spike_distance) * spike_distance,
+        # which avoids NumPy's slow floating point modulo
+        target = None if out is None else out[1]
+        displaced = np.divide(xmesh, spike_distance, out=_fitting(target, xmesh))
+        np.floor(displaced, out=displaced)
+        displaced *= -spike_distance
+        displaced += xmesh
+        displaced -= spike_distance // 2
+        np.abs(displaced, out=displaced)
+        displaced *= magnitude * 2
+        displaced = _add_mesh(displaced, ymesh, out=target)
+        return xmesh, displaced
 
     @staticmethod
     def horizontal_spike(
-        xmesh: NDArray, ymesh: NDArray, magnitude: float = 1, spikenum: float = 5
+        xmesh: NDArray,
+        ymesh: NDArray,
+        magnitude: float = 1,
+        spikenum: float = 5,
+        shape: tuple[int, int] | None = None,
+        out: tuple[NDArray, NDArray] | None = None,
     ) -> tuple[NDArray, NDArray]:
         """
         Add horizontal spikes to Image
@@ -96,16 +212,32 @@ class Effect:
         :param ymesh: a mesh grid for y-axis
         :param magnitude: the magnitude for horizontal spikes
         :param spikenum: number of spikes
+        :param shape: the height and width of the whole canvas, if the meshes only cover part of it
+        :param out: buffers for the displaced xmesh and ymesh, instead of new arrays
         :return: xmesh, ymesh
         """
-        height, _ = xmesh.shape
+        height, _ = shape or np.broadcast_shapes(xmesh.shape, ymesh.shape)
         spike_distance = height // spikenum
-        offset = np.abs(ymesh % spike_distance - spike_distance // 2) * magnitude * 2
-        return xmesh + offset, ymesh
+        # ymesh % spike_distance as ymesh - floor(ymesh / spike_distance) * spike_distance,
+        # which avoids NumPy's slow floating point modulo
+        target = None if out is None else out[0]
+        displaced = np.divide(ymesh, spike_distance, out=_fitting(target, ymesh))
+        np.floor(displaced, out=displaced)
+        displaced *= -spike_distance
+        displaced += ymesh
+        displaced -= spike_distance // 2
+        np.abs(displaced, out=displaced)
+        displaced *= magnitude * 2
+        displaced = _add_mesh(displaced, xmesh, out=target)
+        return displaced, ymesh
 
     @staticmethod
     def explode(
-        xmesh: NDArray, ymesh: NDArray, magnitude: float = 1
+        xmesh: NDArray,
+        ymesh: NDArray,
+        magnitude: float = 1,
+        shape: tuple[int, int] | None = None,
+        out: tuple[NDArray, NDArray] | None = None,
     ) -> tuple[NDArray, NDArray]:
         """
         Creates a motion outward from the center
@@ -113,27 +245,77 @@ class Effect:
         :param xmesh: a mesh grid for x-axis
         :param ymesh: a mesh grid for y-axis
         :param magnitude: the magnitude of the effect
+        :param shape: the height and width of the whole canvas, if the meshes only cover part of it
+        :param out: buffers for the displaced xmesh and ymesh, instead of new arrays
         :return: xmesh, ymesh
         """
-        height, width = xmesh.shape
-        normalized_distance = (
-            (2 * xmesh / width - 1) ** 2 + (2 * ymesh / height - 1) ** 2
-        ) ** 0.5
-        new_distance = normalized_distance / (
-            np.maximum(
-                (1.5 - normalized_distance) * 3 * (abs(magnitude) + 0.000001) ** 0.8
-                + 0.2,
-                1,
-            )
-            + 0.0000001
+        height, width = shape or np.broadcast_shapes(xmesh.shape, ymesh.shape)
+        cx, cy = width / 2, height / 2
+        # Full size offsets, so they can be scaled in place even for sparse meshes
+        mesh_shape = np.broadcast_shapes(xmesh.shape, ymesh.shape)
+        xout, yout = out or (None, None)
+        dx = np.subtract(np.broadcast_to(xmesh, mesh_shape), cx, out=xout)
+        dy = np.subtract(np.broadcast_to(ymesh, mesh_shape), cy, out=yout)
+        strength = 3 * (abs(magnitude) + 0.000001) ** 0.8
+        # new_distance / normalized_distance, computed in place as one array
+        ratio = np.hypot(dx / cx, dy / cy)
+        ratio *= -strength
+        ratio += 1.5 * strength + 0.2
+        np.clip(ratio, 1, None, out=ratio)
+        ratio += 0.0000001
+        np.reciprocal(ratio, out=ratio)
+        dx *= ratio
+        dx += cx
+        dy *= ratio
+        dy += cy
+        return dx, dy
+
+    @staticmethod
+    def spiral(
+        xmesh: NDArray,
+        ymesh: NDArray,
+        magnitude: float = 1,
+        shape: tuple[int, int] | None = None,
+        out: tuple[NDArray, NDArray] | None = None,
+    ) -> tuple[NDArray, NDArray]:
+        """
+        Twists the image around its center, strongest at the center
+
+        :param xmesh: a mesh grid for x-axis
+        :param ymesh: a mesh grid for y-axis
+        :param magnitude: the rotation at the center in radians
+        :param shape: the height and width of the whole canvas, if the meshes only cover part of it
+        :param out: buffers for the displaced xmesh and ymesh, instead of new arrays
+        :return: xmesh, ymesh
+        """
+        height, width = shape or np.broadcast_shapes(xmesh.shape, ymesh.shape)
+        cx, cy = width / 2, height / 2
+        distance_scale = min(width, height) * 0.45
+        dx = xmesh - cx
+        dy = ymesh - cy
+        distance = np.hypot(dx, dy) + 0.1
+        theta = (
+            magnitude
+            * np.clip((distance_scale - distance) / distance_scale, 0, None) ** 0.4
         )
-        xmesh = (xmesh - width / 2) * new_distance / normalized_distance + width / 2
-        ymesh = (ymesh - height / 2) * new_distance / normalized_distance + height / 2
-        return xmesh, ymesh
+        cos_theta = np.cos(theta)
+        sin_theta = np.sin(theta)
+        xout, yout = out or (None, None)
+        xsource = np.multiply(dx, cos_theta, out=xout)
+        xsource += dy * sin_theta
+        xsource += cx
+        ysource = np.multiply(dy, cos_theta, out=yout)
+        ysource -= dx * sin_theta
+        ysource += cy
+        return xsource, ysource
 
 
 def explode(
-    xmesh: NDArray, ymesh: NDArray, magnitude: float = 1
+    xmesh: NDArray,
+    ymesh: NDArray,
+    magnitude: float = 1,
+    shape: tuple[int, int] | None = None,
+    out: tuple[NDArray, NDArray] | None = None,
 ) -> tuple[NDArray, NDArray]:
     """
     Creates a motion outward from the center - work in progress
@@ -141,22 +323,130 @@ def explode(
     :param xmesh: a mesh grid for x-axis
     :param ymesh: a mesh grid for y-axis
     :param magnitude: the magnitude of the effect
+    :param shape: the height and width of the whole canvas, if the meshes only cover part of it
+    :param out: buffers for the displaced xmesh and ymesh, instead of new arrays
     :return: xmesh, ymesh
     """
-    height, width = xmesh.shape
-    normalized_distance = (
-        (xmesh / width - 0.5) ** 2 + (ymesh / height - 0.5) ** 2
-    ) ** 0.5
-    new_distance = normalized_distance / (
-        np.maximum((1 - normalized_distance) * 3 * magnitude, 1) + 0.1
-    )
-    xmesh = (xmesh - width / 2) * new_distance / normalized_distance + width / 2
-    ymesh = (ymesh - height / 2) * new_distance / normalized_distance + height / 2
-    return xmesh, ymesh
+    height, width = shape or np.broadcast_shapes(xmesh.shape, ymesh.shape)
+    cx, cy = width / 2, height / 2
+    # Full size offsets, so they can be scaled in place even for sparse meshes
+    mesh_shape = np.broadcast_shapes(xmesh.shape, ymesh.shape)
+    xout, yout = out or (None, None)
+    dx = np.subtract(np.broadcast_to(xmesh, mesh_shape), cx, out=xout)
+    dy = np.subtract(np.broadcast_to(ymesh, mesh_shape), cy, out=yout)
+    # new_distance / normalized_distance, computed in place as one array
+    ratio = np.hypot(dx / width, dy / height)
+    np.subtract(1, ratio, out=ratio)
+    ratio *= 3 * magnitude
+    np.clip(ratio, 1, None, out=ratio)
+    ratio += 0.1
+    np.reciprocal(ratio, out=ratio)
+    dx *= ratio
+    dx += cx
+    dy *= ratio
+    dy += cy
+    return dx, dy
+
+
+def _cut_stripe(mesh: NDArray, top: int, bottom: int) -> NDArray:
+    """
+    Cut a horizontal stripe from a mesh, which is the whole mesh if it is a single row
+
+    :param mesh: a mesh grid
+    :param top: the first row of the stripe
+    :param bottom: the row after the stripe
+    :return: the stripe
+    """
+    if mesh.shape[0] == 1:
+        return mesh
+    return mesh[top:bottom]
+
+
+def _join_stripes(
+    mesh: NDArray,
+    stripes: Sequence[NDArray],
+    outputs: Sequence[NDArray],
+    buffer: NDArray | None = None,
+    buffer_stripes: Sequence[NDArray] = (),
+) -> NDArray:
+    """
+    Join the stripes of a mesh returned by an effect
+
+    :param mesh: the mesh the stripes were cut from
+    :param stripes: the stripes passed to the effect
+    :param outputs: the stripes returned by the effect
+    :param buffer: the output buffer passed to the effect in stripes, if any
+    :param buffer_stripes: the stripes of the output buffer
+    :return: the whole mesh
+    """
+    # Keep a mesh the effect did not move, or wrote into the buffer, instead of
+    # copying its stripes back together
+    if all(output is stripe for stripe, output in zip(stripes, outputs)):
+        return mesh
+    if buffer is not None and all(output is stripe for stripe, output in zip(buffer_stripes, outputs)):
+        return buffer
+    return np.concatenate(outputs)
+
+
+def _fold_index(index: NDArray, size: int, fill_method: OFF_CANVAS_FILL) -> NDArray:
+    """
+    Move pixel indices from outside the canvas back onto it, matching the OpenCV border modes
+
+    :param index: pixel indices along one axis
+    :param size: the size of the canvas along that axis
+    :param fill_method: the method used to fill pixels from outside the canvas
+    :return: indices between 0 and size - 1
+    """
+    if fill_method == OFF_CANVAS_FILL.EDGE:
+        return np.clip(index, 0, size - 1)
+    if fill_method == OFF_CANVAS_FILL.WRAP:
+        return index % size
+    # Mirror without repeating the edge pixel's neighbour: ...cba|abc...xyz|zyx...
+    index = index % (2 * size)
+    return np.where(index < size, index, 2 * size - 1 - index)
+
+
+def _put_in_lru(cache: OrderedDict, key: Hashable, value: Any, capacity: int) -> None:
+    """
+    Put an item in an LRU cache, evicting the least recently used item if it is full
+
+    :param cache: the cache
+    :param key:
+    :param value:
+    :param capacity: the maximum number of items in the cache
+    :return:
+    """
+    if len(cache) >= capacity:
+        cache.popitem(last=False)
+    cache[key] = value
+
+
+@lru_cache(maxsize=None)
+def _effect_options(func: Callable) -> frozenset[str]:
+    """
+    Find which of the optional shape and out arguments an effect accepts
+
+    :param func: the effect
+    :return: the names of the optional arguments it accepts
+    """
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return frozenset()
+    if any(parameter.kind == parameter.VAR_KEYWORD for parameter in parameters):
+        return frozenset(("shape", "out"))
+    return frozenset(parameter.name for parameter in parameters if parameter.name in ("shape", "out"))
 
 
 class MotionTransformer:
-    """Processes all motion effects together to save on pre-processing and post-processing required for each"""
+    """
+    Processes all motion effects together to save on pre-processing and post-processing required for each
+
+    Effects only need to take xmesh, ymesh and magnitude.  Effects that also
+    accept the shape of the canvas are applied to stripes of sparse meshes in
+    parallel, and those that accept out buffers write into them, while any
+    other effect gets full size meshes in one piece.
+    """
 
     def __init__(
         self,
@@ -171,19 +461,29 @@ class MotionTransformer:
             Effect.horizontal_spike,
             Effect.explode,
         ),
+        backend: REMAP_BACKEND = REMAP_BACKEND.CPU,
     ) -> None:
         self.img = img
         self.answer = answer
         self.interpolation = interpolation
         self.fill_method = fill_method
         self.funclist = tuple(funclist)
+        self.backend = backend
         self._generate_mesh()
+        self._cache_image()
         self.xmesh: NDArray
         self.ymesh: NDArray
+        # Keyed by the (effect name, magnitude) steps applied so far, so dragging
+        # one slider reuses the meshes of all effects before it
         self.cache: OrderedDict[
-            tuple[str, float], tuple[NDArray, NDArray]
+            tuple[tuple[str, float], ...], tuple[NDArray, NDArray]
         ] = OrderedDict()
         self.cache_capacity: int = 10
+        # Remap lookup tables in OpenCV's fixed point format, keyed by the
+        # interpolation and all magnitudes
+        self._lut_cache: OrderedDict[
+            tuple[PIXEL_INTERPOLATION_METHOD, tuple[float, ...]], tuple[Any, Any]
+        ] = OrderedDict()
 
         self.offsets = []
         for letter in self.answer.upper():
@@ -191,11 +491,12 @@ class MotionTransformer:
 
     def reset_cache(self) -> None:
         """
-        Reset the cache of intermediate steps between effects
+        Reset the cache of intermediate steps between effects and of finished lookup tables
 
         :return:
         """
         self.cache = OrderedDict()
+        self._lut_cache = OrderedDict()
 
     def update_image(self, img: Image.Image) -> None:
         """
@@ -204,9 +505,11 @@ class MotionTransformer:
         :param img: the image
         :return:
         """
-        if img.size != self.img.size:
-            self._generate_mesh()
+        size_changed = img.size != self.img.size
         self.img = img
+        if size_changed:
+            self._generate_mesh()
+        self._cache_image()
 
     def calculate_output(self, magnitudelist: Iterable[float]) -> Image.Image:
         """
@@ -215,22 +518,164 @@ class MotionTransformer:
         :param magnitudelist: the list of magnitudes
         :return:
         """
-        xmesh, ymesh = self.xmesh, self.ymesh
-        for func, magnitude, offset in zip(self.funclist, magnitudelist, self.offsets):
-            xmesh, ymesh = func(xmesh, ymesh, (magnitude - offset) / 20)
-        xmesh = xmesh.astype(int) % self.img.width
-        ymesh = ymesh.astype(int) % self.img.height
-        np_img = np.array(self.img)
-        np_img = np_img[ymesh.flatten(), xmesh.flatten()].reshape(np_img.shape)
+        magnitudes = tuple(
+            (magnitude - offset) / 20
+            for magnitude, offset in zip(magnitudelist, self.offsets)
+        )
+        key = (self.interpolation, magnitudes)
+        if key in self._lut_cache:
+            self._lut_cache.move_to_end(key)
+            map1, map2 = self._lut_cache[key]
+        else:
+            map1, map2 = self._calculate_lut(magnitudes)
+            _put_in_lru(self._lut_cache, key, (map1, map2), self.cache_capacity)
+        remap_options = {
+            "interpolation": _CV2_INTERPOLATION[self.interpolation],
+            "borderMode": _CV2_BORDER[self.fill_method],
+        }
+        try:
+            if self._gpu_img is not None:
+                gpu_output = cv2.remap(self._gpu_img, map1, map2, **remap_options)
+                return Image.fromarray(gpu_output.get())
+            np_img = cv2.remap(self._np_img, map1, map2, **remap_options)
+        except cv2.error:
+            # OpenCV cannot remap some pixel types, such as the booleans of 1-bit images
+            np_img = self._gather(map1)
         return Image.fromarray(np_img)
 
+    def _gather(self, map1: Any) -> NDArray:
+        """
+        Look up the source pixel of every output pixel with NumPy, for images OpenCV cannot remap
+
+        :param map1: the fixed point map holding the source x and y of every output pixel
+        :return: the output image as an array
+        """
+        if isinstance(map1, cv2.UMat):
+            map1 = map1.get()
+        height, width = self._np_img.shape[:2]
+        xindex = _fold_index(map1[..., 0].astype(np.int32), width, self.fill_method)
+        yindex = _fold_index(map1[..., 1].astype(np.int32), height, self.fill_method)
+        flat_img = self._np_img.reshape(height * width, *self._np_img.shape[2:])
+        np_img = np.take(flat_img, (yindex * width + xindex).ravel(), axis=0)
+        return np_img.reshape(self._np_img.shape)
+
+    def _calculate_lut(self, magnitudes: Iterable[float]) -> tuple[Any, Any]:
+        """
+        Run the effect chain and convert the resulting meshes into a remap lookup table
+
+        :param magnitudes: the magnitude of each effect
+        :return: the two maps cv2.remap takes
+        """
+        magnitudes = tuple(magnitudes)
+        xmesh, ymesh = self.xmesh, self.ymesh
+        last = max((index for index, magnitude in enumerate(magnitudes) if magnitude != 0), default=-1)
+        steps: tuple[tuple[str, float], ...] = ()
+        for index, (func, magnitude) in enumerate(zip(self.funclist, magnitudes)):
+            steps += ((func.__name__, magnitude),)
+            if magnitude == 0:
+                # Every effect leaves the mesh untouched without a magnitude
+                continue
+            if steps in self.cache:
+                self.cache.move_to_end(steps)
+                xmesh, ymesh = self.cache[steps]
+            elif index == last:
+                # The last effect's meshes only live until they are converted
+                # below, so they go straight into the scratch buffers uncached
+                xmesh, ymesh = self._apply_striped(func, xmesh, ymesh, magnitude, out=self._scratch)
+            else:
+                xmesh, ymesh = self._apply_striped(func, xmesh, ymesh, magnitude)
+                _put_in_lru(self.cache, steps, (xmesh, ymesh), self.cache_capacity)
+        # Expand sparse or cached meshes into the scratch buffers, which
+        # convertMaps needs as full size, contiguous float32 arrays
+        for mesh, buffer in zip((xmesh, ymesh), self._scratch):
+            if mesh is not buffer:
+                np.copyto(buffer, mesh)
+        # Fixed point maps are smaller than float ones and take OpenCV's fastest remap path
+        map1, map2 = cv2.convertMaps(
+            *self._scratch,
+            cv2.CV_16SC2,
+            nninterpolation=self.interpolation == PIXEL_INTERPOLATION_METHOD.INTEGER,
+        )
+        if self._gpu_img is not None:
+            map1 = cv2.UMat(map1)
+            map2 = None if map2 is None else cv2.UMat(map2)
+        return map1, map2
+
+    def _apply_striped(
+        self,
+        func: Callable,
+        xmesh: NDArray,
+        ymesh: NDArray,
+        magnitude: float,
+        out: tuple[NDArray, NDArray] | None = None,
+    ) -> tuple[NDArray, NDArray]:
+        """
+        Apply an effect to horizontal stripes of the meshes in parallel
+
+        :param func: the effect
+        :param xmesh: a mesh grid for x-axis
+        :param ymesh: a mesh grid for y-axis
+        :param magnitude: the magnitude of the effect
+        :param out: full size buffers for the displaced xmesh and ymesh, instead of new arrays
+        :return: xmesh, ymesh
+        """
+        options = _effect_options(func)
+        if "shape" not in options:
+            # Without the canvas size an effect can only be given the whole, full size meshes
+            return func(*np.broadcast_arrays(xmesh, ymesh), magnitude)
+        if "out" not in options:
+            out = None
+        kwargs = {} if out is None else {"out": out}
+        shape = (self.img.height, self.img.width)
+        stripe_count = min(os.cpu_count() or 1, self.img.height // _MIN_STRIPE_ROWS)
+        if stripe_count <= 1:
+            return func(xmesh, ymesh, magnitude, shape=shape, **kwargs)
+        edges = np.linspace(0, self.img.height, stripe_count + 1, dtype=int)
+        bounds = list(zip(edges, edges[1:]))
+        xstripes = [_cut_stripe(xmesh, top, bottom) for top, bottom in bounds]
+        ystripes = [_cut_stripe(ymesh, top, bottom) for top, bottom in bounds]
+        out_stripes = [None if out is None else (out[0][top:bottom], out[1][top:bottom]) for top, bottom in bounds]
+        futures = [
+            _STRIPE_POOL.submit(
+                func, xstripe, ystripe, magnitude, shape=shape, **({} if out_stripe is None else {"out": out_stripe})
+            )
+            for xstripe, ystripe, out_stripe in zip(xstripes, ystripes, out_stripes)
+        ]
+        xoutputs, youtputs = zip(*(future.result() for future in futures))
+        xbuffer, ybuffer = out or (None, None)
+        return (
+            _join_stripes(xmesh, xstripes, xoutputs, xbuffer, [stripe[0] for stripe in out_stripes if stripe]),
+            _join_stripes(ymesh, ystripes, youtputs, ybuffer, [stripe[1] for stripe in out_stripes if stripe]),
+        )
+
+    def _cache_image(self) -> None:
+        """
+        Convert the image to an array, and copy it to the device, once per image instead of once per output
+
+        :return:
+        """
+        self._np_img: NDArray = np.ascontiguousarray(np.asarray(self.img))
+        self._gpu_img: cv2.UMat | None = None
+        if self.backend == REMAP_BACKEND.OPENCL:
+            self._gpu_img = cv2.UMat(self._np_img)
+
     def _generate_mesh(self) -> None:
         """
         Generate the mesh grid all distortions will be applied to
 
+        The grid is sparse, a (1, width) row and a (height, 1) column, and only
+        becomes full size where an effect combines the two.
+
         :return:
         """
         self.xmesh, self.ymesh = np.meshgrid(
-            np.arange(self.img.width), np.arange(self.img.height), sparse=False
+            np.arange(self.img.width, dtype=np.float32),
+            np.arange(self.img.height, dtype=np.float32),
+            sparse=True,
+        )
+        # Reused by every call for the meshes of the last effect and the maps' input
+        self._scratch = (
+            np.empty((self.img.height, self.img.width), dtype=np.float32),
+            np.empty((self.img.height, self.img.width), dtype=np.float32),
         )
         self.reset_cache()
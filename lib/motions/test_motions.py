@@ -0,0 +1,237 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image
+
+from .motions import (
+    OFF_CANVAS_FILL, PIXEL_INTERPOLATION_METHOD, REMAP_BACKEND, Effect,
+    MotionTransformer, explode
+)
+
+
+class EffectTestCase(unittest.TestCase):
+    """Tests for the Effect functions in motions.py"""
+
+    def setUp(self) -> None:
+        """Create a mesh grid for a non-square canvas"""
+        self.xmesh, self.ymesh = np.meshgrid(np.arange(64), np.arange(48))
+
+    def test_zero_magnitude_is_identity(self) -> None:
+        """
+        Test that applying an effect with zero magnitude leaves the mesh unchanged.
+
+        :return: None
+        """
+        for func in (
+            Effect.vertical_wave,
+            Effect.horizontal_wave,
+            Effect.vertical_spike,
+            Effect.horizontal_spike,
+            Effect.explode,
+            Effect.spiral,
+        ):
+            xmesh, ymesh = func(self.xmesh, self.ymesh, 0)
+            np.testing.assert_allclose(xmesh, self.xmesh, atol=1e-4, err_msg=func.__name__)
+            np.testing.assert_allclose(ymesh, self.ymesh, atol=1e-4, err_msg=func.__name__)
+
+    def test_out_buffers_match_new_arrays(self) -> None:
+        """
+        Test that effects write the meshes they move into the given buffers, with the same values as new arrays.
+
+        :return: None
+        """
+        xmesh, ymesh = np.meshgrid(np.arange(64, dtype=np.float32), np.arange(48, dtype=np.float32), sparse=True)
+        for func in (Effect.vertical_wave, Effect.horizontal_spike, Effect.explode, Effect.spiral, explode):
+            out = (np.empty((48, 64), dtype=np.float32), np.empty((48, 64), dtype=np.float32))
+            expected = func(xmesh, ymesh, 0.7)
+            buffered = func(xmesh, ymesh, 0.7, out=out)
+            for axis in range(2):
+                if buffered[axis] is not out[axis]:
+                    self.assertIs(buffered[axis], (xmesh, ymesh)[axis], func.__name__)
+                np.testing.assert_allclose(buffered[axis], expected[axis], rtol=1e-6, err_msg=func.__name__)
+
+    def test_sparse_meshes_match_full_meshes(self) -> None:
+        """
+        Test that effects give the same result for sparse meshes as for full size ones.
+
+        :return: None
+        """
+        xmesh, ymesh = np.meshgrid(np.arange(64), np.arange(48), sparse=True)
+        for func in (Effect.explode, Effect.spiral, explode):
+            expected = func(self.xmesh, self.ymesh, 0.7)
+            sparse = func(xmesh, ymesh, 0.7)
+            np.testing.assert_allclose(sparse[0], expected[0], rtol=1e-6, err_msg=func.__name__)
+            np.testing.assert_allclose(sparse[1], expected[1], rtol=1e-6, err_msg=func.__name__)
+
+    def test_spiral_keeps_corners(self) -> None:
+        """
+        Test that the spiral only twists the area around the center and leaves the corners in place.
+
+        :return: None
+        """
+        xmesh, ymesh = Effect.spiral(self.xmesh, self.ymesh, 2)
+        self.assertEqual(xmesh.shape, self.xmesh.shape)
+        self.assertAlmostEqual(float(xmesh[0, 0]), 0, places=4)
+        self.assertAlmostEqual(float(ymesh[-1, -1]), 47, places=4)
+        self.assertFalse(np.allclose(xmesh[24, 20:44], self.xmesh[24, 20:44]))
+
+
+class MotionTransformerTestCase(unittest.TestCase):
+    """Tests for the MotionTransformer in motions.py"""
+
+    def setUp(self) -> None:
+        """Create a random image and a transformer for it"""
+        rng = np.random.default_rng(0)
+        self.np_img = rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
+        self.answer = "codes"
+        self.transformer = MotionTransformer(Image.fromarray(self.np_img), self.answer)
+
+    def test_solved_puzzle_restores_image(self) -> None:
+        """
+        Test that setting every slider to its letter of the answer gives back the original image.
+
+        :return: None
+        """
+        magnitudes = [ord(letter) - 65 for letter in self.answer.upper()]
+        output = self.transformer.calculate_output(magnitudes)
+        self.assertEqual(output.size, (64, 48))
+        np.testing.assert_array_equal(np.asarray(output), self.np_img)
+
+    def test_output_preserves_size_and_mode(self) -> None:
+        """
+        Test that a distorted output keeps the size and mode of the input image.
+
+        :return: None
+        """
+        output = self.transformer.calculate_output([0, 5, 10, 15, 20])
+        self.assertEqual(output.size, (64, 48))
+        self.assertEqual(output.mode, "RGB")
+
+    def test_cache_reuses_unchanged_effects(self) -> None:
+        """
+        Test that moving only the last slider reuses the cached meshes of the effects before it.
+
+        :return: None
+        """
+        first = self.transformer.calculate_output([0, 5, 10, 15, 20])
+        cached = dict(self.transformer.cache)
+        second = self.transformer.calculate_output([0, 5, 10, 15, 3])
+        prefix = next(steps for steps in cached if len(steps) == 4)
+        self.assertIs(self.transformer.cache[prefix], cached[prefix])
+        self.assertNotEqual(first.tobytes(), second.tobytes())
+        self.assertEqual(
+            self.transformer.calculate_output([0, 5, 10, 15, 20]).tobytes(), first.tobytes()
+        )
+
+    def test_fill_methods(self) -> None:
+        """
+        Test that pixels pulled from off the canvas are filled according to the fill method.
+
+        :return: None
+        """
+        row = np.arange(8, dtype=np.uint8).reshape(1, 8)
+        shift_left = (lambda xmesh, ymesh, magnitude: (xmesh + 3, ymesh),)
+        expected = {
+            OFF_CANVAS_FILL.WRAP: [3, 4, 5, 6, 7, 0, 1, 2],
+            OFF_CANVAS_FILL.MIRROR: [3, 4, 5, 6, 7, 7, 6, 5],
+            OFF_CANVAS_FILL.EDGE: [3, 4, 5, 6, 7, 7, 7, 7],
+        }
+        for fill_method, pixels in expected.items():
+            transformer = MotionTransformer(
+                Image.fromarray(row), "a", fill_method=fill_method, funclist=shift_left
+            )
+            output = transformer.calculate_output([20])
+            self.assertEqual(np.asarray(output).ravel().tolist(), pixels, fill_method)
+
+    def test_opencl_backend_matches_cpu(self) -> None:
+        """
+        Test that the OpenCL backend produces the same output as the CPU, with or without a GPU.
+
+        :return: None
+        """
+        transformer = MotionTransformer(
+            Image.fromarray(self.np_img), self.answer, backend=REMAP_BACKEND.OPENCL
+        )
+        magnitudes = [0, 5, 10, 15, 20]
+        self.assertEqual(
+            transformer.calculate_output(magnitudes).tobytes(),
+            self.transformer.calculate_output(magnitudes).tobytes(),
+        )
+
+    def test_update_image_with_new_size(self) -> None:
+        """
+        Test that switching to an image of another size distorts the new image at its own size.
+
+        :return: None
+        """
+        self.transformer.calculate_output([0, 5, 10, 15, 20])
+        self.transformer.update_image(Image.new("RGB", (30, 20), (255, 0, 0)))
+        output = self.transformer.calculate_output([0, 5, 10, 15, 20])
+        self.assertEqual(output.size, (30, 20))
+        self.assertEqual(output.getcolors(), [(600, (255, 0, 0))])
+
+    def test_striped_effects_match_whole_mesh(self) -> None:
+        """
+        Test that applying an effect to stripes of a tall mesh gives the same result as the whole mesh.
+
+        :return: None
+        """
+        transformer = MotionTransformer(Image.new("RGB", (50, 300)), "a")
+        for func in (Effect.horizontal_wave, Effect.vertical_spike, Effect.explode, explode):
+            expected = func(transformer.xmesh, transformer.ymesh, 0.7)
+            with patch("os.cpu_count", return_value=4):
+                striped = transformer._apply_striped(func, transformer.xmesh, transformer.ymesh, 0.7)
+            np.testing.assert_allclose(striped[0], expected[0], rtol=1e-6, err_msg=func.__name__)
+            np.testing.assert_allclose(striped[1], expected[1], rtol=1e-6, err_msg=func.__name__)
+
+    def test_effects_without_shape_or_out(self) -> None:
+        """
+        Test that effects taking only the meshes and magnitude get full size meshes, with or without stripes.
+
+        :return: None
+        """
+        def squeeze(xmesh: np.ndarray, ymesh: np.ndarray, magnitude: float) -> tuple[np.ndarray, np.ndarray]:
+            height, width = xmesh.shape
+            return xmesh * (1 + magnitude / width), ymesh * (1 + magnitude / height)
+
+        for size in ((64, 48), (50, 300)):
+            transformer = MotionTransformer(Image.new("RGB", size), "a", funclist=(squeeze,))
+            xmesh, ymesh = np.meshgrid(np.arange(size[0]), np.arange(size[1]))
+            with patch("os.cpu_count", return_value=4):
+                transformer.calculate_output([20])
+            expected = squeeze(xmesh, ymesh, 1)
+            np.testing.assert_allclose(transformer._scratch[0], expected[0], rtol=1e-6)
+            np.testing.assert_allclose(transformer._scratch[1], expected[1], rtol=1e-6)
+
+    def test_lookup_table_cache(self) -> None:
+        """
+        Test that repeated magnitudes reuse their lookup table, separately per interpolation method.
+
+        :return: None
+        """
+        first = self.transformer.calculate_output([0, 5, 10, 15, 20])
+        self.transformer.calculate_output([1, 5, 10, 15, 20])
+        self.assertEqual(len(self.transformer._lut_cache), 2)
+        self.assertEqual(self.transformer.calculate_output([0, 5, 10, 15, 20]).tobytes(), first.tobytes())
+        self.assertEqual(len(self.transformer._lut_cache), 2)
+        self.transformer.interpolation = PIXEL_INTERPOLATION_METHOD.LINEAR
+        self.transformer.calculate_output([0, 5, 10, 15, 20])
+        self.assertEqual(len(self.transformer._lut_cache), 3)
+
+    def test_one_bit_image_matches_greyscale(self) -> None:
+        """
+        Test that 1-bit images, which OpenCV cannot remap, are distorted like the same image in greyscale.
+
+        :return: None
+        """
+        grey = Image.fromarray((self.np_img[..., 0] > 127).astype(np.uint8) * 255)
+        for fill_method in OFF_CANVAS_FILL:
+            outputs = [
+                MotionTransformer(img, self.answer, fill_method=fill_method).calculate_output(
+                    [0, 5, 10, 15, 20]
+                )
+                for img in (grey, grey.convert("1"))
+            ]
+            self.assertEqual(outputs[1].mode, "1")
+            self.assertEqual(outputs[0].tobytes(), outputs[1].convert("L").tobytes(), fill_method)
@@ -8,6 +8,31 @@ from PyQt6.QtWidgets import (
 )
 
 from src.utils.q_custom_slider import QCustomSlider
+from src.utils.slider_debouncer import SliderDebouncer
+
+# Stylesheets shared by every ControlPanel, so their text is only built once
+_TITLE_QSS_TEMPLATE = (
+    "QFrame#{object_name}_box"
+    "{{ border: 1px solid 'black'; "
+    "border-radius: 6px; "
+    "background-color: 'white'; }}"
+)
+_TITLE_LABEL_QSS = "font-size: 22px"
+_DESCRIPTION_QSS = "font-size: 16px;"
+_SLIDERFRAME_QSS = (
+    "QFrame#sliderframe { "
+    "border: 1px solid 'black';"
+    "border-radius: 6px;"
+    "background-color: 'white'; }"
+    "QSlider::handle:horizontal {"
+    "background-color: gray;"
+    "width: 20px;"
+    "border-radius: 3px; }"
+    "QSlider::handle:vertical {"
+    "background-color: black;"
+    "height: 20px;"
+    "border-radius: 3px; }"
+)
 
 
 class NoDragSlider(QSlider):
@@ -53,12 +78,22 @@ class ControlPanel(QWidget):
     comboBoxesSwapped = pyqtSignal(str, str)
     ascii = pyqtSignal()
 
-    def __init__(self, title: str, widget_info: dict):
+    def __init__(self, title: str, widget_info: dict, debounce_ms: int | None = None):
+        """
+        Init
+
+        :param title:
+        :param widget_info:
+        :param debounce_ms: if set, forward values while dragging, at most once per this many
+            milliseconds of quiet; otherwise forward only the value a drag ends on
+        """
         super().__init__()
         layout = QVBoxLayout(self)
         self.title = title
         self.combo_boxes = []
         self.description = widget_info.get("description", None)
+        self._debouncer = SliderDebouncer(self, debounce_ms)
+        self._debouncer.valueChanged.connect(self.forward_signal)
 
         title_box = self.create_panel_title(title, self.description)
         layout.addWidget(title_box)
@@ -77,9 +112,7 @@ class ControlPanel(QWidget):
                 )
             else:
                 slider = QCustomSlider(0, 20, 1, orientation)
-            slider.sl.valueChanged.connect(
-                lambda value, lbl=label: self.forward_signal(lbl, value)
-            )
+            self._debouncer.add_slider(label, slider.sl)
             slider_frame = self.style_slider(
                 slider, slider_range, orientation == Qt.Orientation.Horizontal
             )
@@ -159,26 +192,19 @@ class ControlPanel(QWidget):
 
         title_box.setObjectName(object_name + "_box")
         title_box.setMinimumSize(200, 0)
-        title_box.setStyleSheet(
-            f"QFrame#{object_name + '_box'}"
-            "{ border: 1px solid 'black'; "
-            "border-radius: 6px; "
-            "background-color: 'white'; }"
-        )
+        title_box.setStyleSheet(_TITLE_QSS_TEMPLATE.format(object_name=object_name))
 
         title_centre = QVBoxLayout(
             title_box
         )  # Change QHBoxLayout to QVBoxLayout for vertical stacking
 
         title = QLabel(name)
-        title.setStyleSheet("font-size: 22px")
+        title.setStyleSheet(_TITLE_LABEL_QSS)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         desc_label: ScrollLabel = ScrollLabel()
         desc_label.setText(description)
-        desc_label.setStyleSheet(
-            "font-size: 16px;"
-        )  # Add some styling for the description
+        desc_label.setStyleSheet(_DESCRIPTION_QSS)  # Add some styling for the description
 
         title_centre.addWidget(title)
         title_centre.addWidget(desc_label)
@@ -199,20 +225,7 @@ class ControlPanel(QWidget):
         """
         slider_frame = QFrame()
         slider_frame.setObjectName("sliderframe")
-        slider_frame.setStyleSheet(
-            "QFrame#sliderframe { "
-            "border: 1px solid 'black';"
-            "border-radius: 6px;"
-            "background-color: 'white'; }"
-            "QSlider::handle:horizontal {"
-            "background-color: gray;"
-            "width: 20px;"
-            "border-radius: 3px; }"
-            "QSlider::handle:vertical {"
-            "background-color: black;"
-            "height: 20px;"
-            "border-radius: 3px; }"
-        )
+        slider_frame.setStyleSheet(_SLIDERFRAME_QSS)
 
         if horizontal:
             slider_layout = QHBoxLayout(slider_frame)
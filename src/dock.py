@@ -1,14 +1,14 @@
 from pathlib import Path
 from typing import Callable, Dict
 
-from PyQt6.QtCore import QSize, pyqtSignal
-from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtCore import QSize, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QIcon, QImage, QPixmap
 from PyQt6.QtWidgets import (
     QFrame, QHBoxLayout, QLabel, QLineEdit, QPushButton, QStackedLayout,
     QWidget
 )
 
-from src.filter import apply_filter
+from src.filter import FilterJob, apply_filter
 from src.image_viewer import ImageViewer
 from src.level import Level
 
@@ -29,6 +29,11 @@ class Dock(QWidget):
         self.image_display = image_display
         self.filters = []
         self.args_cache: Dict[str, int | str] = {}
+        # Filters run one at a time off the GUI thread, since a MotionTransformer
+        # must not be used by two threads at once
+        self._filter_pool = QThreadPool(self)
+        self._filter_pool.setMaxThreadCount(1)
+        self._filter_generation = 0
 
         for _, control_panel, args in self.level.filters:
             control_panel.sliderValueChanged.connect(
@@ -166,11 +171,6 @@ class Dock(QWidget):
         # Update the cache with the slider value
         self.args_cache[label] = value
 
-        # Only update args if the keys are present in args_cache
-        for key, val in args.items():
-            if key in self.args_cache.keys():
-                self.args_cache[key] = args[key]
-
         args_to_pass = self.args_cache
         args_to_pass["second_image"] = args["second_image"]
         args_to_pass["image_to_edit"] = str(self.level.get_image_source())
@@ -179,14 +179,11 @@ class Dock(QWidget):
         args_to_pass["image_label_w"] = size.width()
         args_to_pass["image_label_h"] = size.height()
 
-        new_image = apply_filter(filter_title, args_to_pass)
-        self.update_image(new_image)
+        self._start_filter_job(filter_title, args_to_pass)
 
     def button_pressed_with_two_values(self, filter_title: str, args: dict) -> None:
         """Update the args_cache and then apply the filter with the updated args"""
-        # Only update args if the keys are present in args_cache
-        for key, val in args.items():
-            self.args_cache[key] = args[key]
+        self.args_cache.update(args)
 
         args_to_pass = self.args_cache
         args_to_pass["image_to_edit"] = str(self.level.get_image_source())
@@ -194,8 +191,33 @@ class Dock(QWidget):
         args_to_pass["image_label_w"] = size.width()
         args_to_pass["image_label_h"] = size.height()
 
-        new_image = apply_filter(filter_title, args_to_pass)
-        self.update_image(new_image)
+        self._start_filter_job(filter_title, args_to_pass)
+
+    def _start_filter_job(self, filter_title: str, args: dict) -> None:
+        """
+        Apply a filter on the worker thread, superseding any job that has not shown its image yet
+
+        :param filter_title:
+        :param args:
+        :return:
+        """
+        self._filter_generation += 1
+        # Drop queued jobs, only the newest arguments are worth rendering
+        self._filter_pool.clear()
+        job = FilterJob(filter_title, dict(args), self._filter_generation)
+        job.signals.finished.connect(self._show_filter_result)
+        self._filter_pool.start(job)
+
+    def _show_filter_result(self, generation: int, image: QImage) -> None:
+        """
+        Show the image of a filter job, unless a newer job has been started since
+
+        :param generation:
+        :param image:
+        :return:
+        """
+        if generation == self._filter_generation:
+            self.update_image(QPixmap.fromImage(image))
 
     def update_image(self, image: QPixmap) -> None:
         """
@@ -215,7 +237,11 @@ class Dock(QWidget):
         args_to_pass = self.args_cache
         args_to_pass["image_to_edit"] = str(self.level.get_image_source())
         args_to_pass["secret"] = self.level.get_secret_answer()
-        new_image = apply_filter(filter_title, args_to_pass)
+        # Wait for slider jobs, so none of them replaces the ASCII art afterwards
+        self._filter_generation += 1
+        self._filter_pool.clear()
+        self._filter_pool.waitForDone()
+        new_image = QPixmap.fromImage(apply_filter(filter_title, args_to_pass))
 
         # Replace QLabel image with ImageViewer to allow mouse wheel and drag event for zooming
         image_viewer = ImageViewer(QSize(self.img_label.width(), self.img_label.height()))
@@ -1,15 +1,22 @@
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
+import importlib
+from functools import lru_cache
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, QRunnable, Qt, pyqtSignal
+from PyQt6.QtGui import QImage
 from PyQt6.QtWidgets import (
-    QFrame, QHBoxLayout, QLabel, QSlider, QVBoxLayout, QWidget
+    QFormLayout, QFrame, QHBoxLayout, QLabel, QSlider, QVBoxLayout, QWidget
 )
 
-from src.utils.apply_ascii_art import apply_ascii_art
-from src.utils.apply_color_swap import apply_color_swap
-from src.utils.apply_double_exposure import apply_double_exposure
-from src.utils.apply_motions import apply_motion
-from src.utils.apply_unmask_reverse_ishihara import (
-    apply_unmask_reverse_ishihara
+from src.control_panel import _TITLE_LABEL_QSS, _TITLE_QSS_TEMPLATE
+from src.utils.slider_debouncer import SliderDebouncer
+
+# The slider frame of a ControlPanel, without its custom slider handles
+_SLIDERFRAME_QSS = (
+    "QFrame#sliderframe { "
+    "border: 1px solid 'black';"
+    "border-radius: 6px;"
+    "background-color: 'white'; }"
 )
 
 
@@ -19,36 +26,38 @@ class Filter(QWidget):
     # Define a custom signal to be emitted when any slider changes its value
     sliderValueChanged = pyqtSignal(str, int)
 
-    def __init__(self, name: str, sliders_info: list):
-        """Init"""
+    def __init__(self, name: str, sliders_info: list, debounce_ms: int | None = None):
+        """
+        Init
+
+        :param name:
+        :param sliders_info:
+        :param debounce_ms: if set, emit values while dragging, at most once per this many
+            milliseconds of quiet; otherwise emit only when a slider is released
+        """
         super().__init__()
 
         self.name = name
         self.sliders = {}  # Dictionary to store sliders with their labels as keys
+        self._debouncer = SliderDebouncer(self, debounce_ms)
+        self._debouncer.valueChanged.connect(self._on_slider_value_changed)
 
-        layout = QVBoxLayout(self)
+        layout = QFormLayout(self)
 
         title_box = self.create_panel_title(name)
-        layout.addWidget(title_box)
+        layout.addRow(title_box)
 
         for slider_label, slider_range, slider_orientation in sliders_info:
-            layout.addWidget(QLabel(slider_label))
             slider = QSlider(slider_orientation)
             slider.setRange(*slider_range)
-            slider.valueChanged.connect(
-                lambda value, lbl=slider_label: self._on_slider_value_changed(
-                    lbl, value
-                )
-            )
+            self._debouncer.add_slider(slider_label, slider)
             slider_frame = self.style_slider(
                 slider, slider_range, slider_orientation == Qt.Orientation.Horizontal
             )
-            layout.addWidget(slider_frame)
+            layout.addRow(QLabel(slider_label), slider_frame)
 
             self.sliders[slider_label] = slider
 
-        layout.addStretch()
-
     def _on_slider_value_changed(self, label: str, value: int) -> None:
         """
         Forward the signal from the slider to the main window
@@ -80,16 +89,11 @@ class Filter(QWidget):
         object_name = "_".join(name.lower().split())
         title_box.setObjectName(object_name + "_box")
         title_box.setMinimumSize(200, 0)
-        title_box.setStyleSheet(
-            f"QFrame#{object_name + '_box'}"
-            "{ border: 1px solid 'black'; "
-            "border-radius: 6px; "
-            "background-color: 'white'; }"
-        )
+        title_box.setStyleSheet(_TITLE_QSS_TEMPLATE.format(object_name=object_name))
 
         title_centre = QHBoxLayout(title_box)
         title_label = QLabel(name)
-        title_label.setStyleSheet("font-size: 22px")
+        title_label.setStyleSheet(_TITLE_LABEL_QSS)
         title_centre.addWidget(QLabel())
         title_centre.addWidget(title_label)
         title_centre.addWidget(QLabel())
@@ -108,12 +112,7 @@ class Filter(QWidget):
         """
         slider_frame = QFrame()
         slider_frame.setObjectName("sliderframe")
-        slider_frame.setStyleSheet(
-            "QFrame#sliderframe { "
-            "border: 1px solid 'black';"
-            "border-radius: 6px;"
-            "background-color: 'white'; }"
-        )
+        slider_frame.setStyleSheet(_SLIDERFRAME_QSS)
 
         slider_layout = (
             QHBoxLayout(slider_frame) if horizontal else QVBoxLayout(slider_frame)
@@ -125,7 +124,47 @@ class Filter(QWidget):
         return slider_frame
 
 
-def apply_filter(filter_name: str, args: dict) -> QPixmap:
+# Filters are named as "module:function" and only imported when first applied,
+# so starting the game does not load the image libraries of every filter
+
+# Filters taking their arguments in order, where arguments that are not set yet are 0
+_POSITIONAL_FILTERS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "Double Exposure": (
+        "src.utils.apply_double_exposure:apply_double_exposure",
+        ("image_to_edit", "second_image", "Exposure", "image_label_w", "image_label_h"),
+    ),
+    "Color Swap": (
+        "src.utils.apply_color_swap:apply_color_swap",
+        ("image_to_edit", "first_color", "second_color", "image_label_w", "image_label_h"),
+    ),
+}
+# Filters taking a dictionary of the arguments they use, and their own defaults for the rest
+_DICT_FILTERS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "Ishihara": (
+        "src.utils.apply_unmask_reverse_ishihara:apply_unmask_reverse_ishihara",
+        ("A", "B", "image_to_edit", "image_label_w", "image_label_h"),
+    ),
+    "Hidden in ASCII": (
+        "src.utils.apply_ascii_art:apply_ascii_art",
+        ("image_to_edit", "image_label_w", "image_label_h", "secret"),
+    ),
+    "Motion": (
+        "src.utils.apply_motions:apply_motion",
+        (
+            "MotionTransformer",
+            "horizontal wave",
+            "vertical wave",
+            "horizontal spike",
+            "vertical spike",
+            "explode",
+            "image_label_w",
+            "image_label_h",
+        ),
+    ),
+}
+
+
+def apply_filter(filter_name: str, args: dict) -> QImage:
     """
     Apply a filter to an image
 
@@ -133,71 +172,81 @@ def apply_filter(filter_name: str, args: dict) -> QPixmap:
     :param args:
     :return: img
     """
-    if filter_name == "Double Exposure":
-        args_for_filter = {}
-        for key, value in args.items():
-            if key == "Exposure":
-                args_for_filter["Exposure"] = value
-            if key == "image_to_edit":
-                args_for_filter["image_to_edit"] = value
-            if key == "second_image":
-                args_for_filter["second_image"] = value
-
-        return apply_double_exposure(
-            args_for_filter["image_to_edit"],
-            args_for_filter["second_image"],
-            args_for_filter["Exposure"],
-            args["image_label_w"],
-            args["image_label_h"],
-        )
-    if filter_name == "Ishihara":
-        args_for_filter = {}
-        for key, value in args.items():
-            if key == "A":
-                args_for_filter["A"] = value
-            if key == "B":
-                args_for_filter["B"] = value
-            if key == "image_to_edit":
-                args_for_filter["image_to_edit"] = value
-            if key == "image_label_w":
-                args_for_filter["image_label_w"] = value
-            if key == "image_label_h":
-                args_for_filter["image_label_h"] = value
-        return apply_unmask_reverse_ishihara(
-            args_for_filter
-        )
-    if filter_name == "Color Swap":
-        return apply_color_swap(
-            args.get("image_to_edit", 0),
-            args.get("first_color", 0),
-            args.get("second_color", 0),
-            args["image_label_w"],
-            args["image_label_h"]
-        )
-    if filter_name == "Hidden in ASCII":
-        args_for_filter = {}
-        for key, value in args.items():
-            if key in (
-                    "image_to_edit",
-                    "image_label_w",
-                    "image_label_h",
-                    "secret"
-            ):
-                args_for_filter[key] = value
-        return apply_ascii_art(args_for_filter)
-    if filter_name == "Motion":
-        args_for_filter = {}
-        for key, value in args.items():
-            if key in (
-                    "MotionTransformer",
-                    "horizontal wave",
-                    "vertical wave",
-                    "horizontal spike",
-                    "vertical spike",
-                    "explode",
-                    "image_label_w",
-                    "image_label_h"
-            ):
-                args_for_filter[key] = value
-        return apply_motion(args_for_filter)
-    return QPixmap()
+    if filter_name in _POSITIONAL_FILTERS:
+        _, keys = _POSITIONAL_FILTERS[filter_name]
+        return _apply_cached(filter_name, tuple((key, args.get(key, 0)) for key in keys))
+    if filter_name in _DICT_FILTERS:
+        _, keys = _DICT_FILTERS[filter_name]
+        return _apply_cached(filter_name, tuple((key, args[key]) for key in keys if key in args))
+    return QImage()
+
+
+# Moving a slider back and forth revisits the same few values
+@lru_cache(maxsize=64)
+def _apply_cached(filter_name: str, filter_args: tuple[tuple[str, Any], ...]) -> QImage:
+    """
+    Apply a filter, reusing the image of a recent call with the same arguments
+
+    :param filter_name:
+    :param filter_args: the (key, value) pairs the filter uses, in the order of its registry entry
+    :return: img
+    """
+    if filter_name in _POSITIONAL_FILTERS:
+        reference, _ = _POSITIONAL_FILTERS[filter_name]
+        return _load_filter(reference)(*(value for _, value in filter_args))
+    reference, _ = _DICT_FILTERS[filter_name]
+    return _load_filter(reference)(dict(filter_args))
+
+
+@lru_cache(maxsize=None)
+def _load_filter(reference: str) -> Callable[..., QImage]:
+    """
+    Import a filter function the first time it is used
+
+    :param reference: the filter as "module:function"
+    :return: the filter function
+    """
+    module_name, function_name = reference.split(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def clear_filter_cache() -> None:
+    """
+    Forget the images of recent filter calls, and the images and MotionTransformers they hold on to
+
+    :return:
+    """
+    _apply_cached.cache_clear()
+
+
+class FilterJobSignals(QObject):
+    """Signals of a FilterJob, which cannot have its own as a QRunnable"""
+
+    # The generation of the job and the filtered image
+    finished = pyqtSignal(int, QImage)
+
+
+class FilterJob(QRunnable):
+    """Applies a filter on a worker thread, so the GUI stays responsive"""
+
+    def __init__(self, filter_name: str, args: dict, generation: int):
+        """
+        Init
+
+        :param filter_name:
+        :param args: a copy of the arguments, which must not change while the job runs
+        :param generation: a number identifying the job, so results of superseded jobs can be dropped
+        """
+        super().__init__()
+        self.filter_name = filter_name
+        self.args = args
+        self.generation = generation
+        self.signals = FilterJobSignals()
+
+    def run(self) -> None:
+        """
+        Apply the filter and emit the image, which is only turned into a QPixmap on the GUI thread
+
+        :return:
+        """
+        self.signals.finished.emit(self.generation, apply_filter(self.filter_name, self.args))
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, List, Tuple, cast
+from typing import Callable, Dict, List, Tuple
 
 from PIL import Image
 from PyQt6.QtCore import Qt
@@ -7,7 +7,7 @@ from PyQt6.QtCore import Qt
 from lib.motions.motions import MotionTransformer
 from src.control_panel import ControlPanel
 
-FilterItem = Tuple[Path, ControlPanel, Dict[str, Path | str | None | int]]
+FilterItem = Tuple[Path, ControlPanel, Dict[str, Path | str | None | int | MotionTransformer]]
 FilterList = List[FilterItem]
 letters = [chr(i) for i in range(65, 65 + 21)]
 
@@ -70,8 +70,10 @@ class Level:
 
         icons_dir_path = Path(Path(__file__).parent, "icons")
         image_dir_path = Path(Path(__file__).parent, "images")
-        filters = [
-            [
+        # Only the current level's filters are built, the others would create
+        # widgets and load images for nothing
+        filter_builders: List[Callable[[], FilterList]] = [
+            lambda: [
                 (
                     Path(icons_dir_path, "rishihara.png"),
                     ControlPanel(
@@ -101,7 +103,7 @@ class Level:
                     },
                 ),
             ],
-            [
+            lambda: [
                 (
                     Path(icons_dir_path, "button_sample2.png"),
                     ControlPanel(
@@ -132,7 +134,7 @@ class Level:
                     },
                 ),
             ],
-            [
+            lambda: [
                 (
                     Path(icons_dir_path, "button_sample4.png"),
                     ControlPanel(
@@ -157,7 +159,7 @@ class Level:
                     {},
                 )
             ],
-            [
+            lambda: [
                 (
                     Path(icons_dir_path, "magnifying_glass.png"),
                     ControlPanel(
@@ -183,7 +185,7 @@ class Level:
                     {},
                 )
             ],
-            [
+            lambda: [
                 (
                     Path(icons_dir_path, "motion_icon.png"),
                     ControlPanel(
@@ -247,8 +249,8 @@ class Level:
             ],
         ]
 
-        if 0 <= self.level_number - 1 < len(filters):
-            return cast(FilterList, filters[self.level_number - 1])
+        if 0 <= self.level_number - 1 < len(filter_builders):
+            return filter_builders[self.level_number - 1]()
         else:
             # Return an empty FilterList if out-of-bounds
             return []
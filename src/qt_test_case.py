@@ -0,0 +1,21 @@
+import os
+import sys
+import unittest
+from typing import cast
+
+from PyQt6.QtWidgets import QApplication
+
+# Let the tests create widgets without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+class QtTestCase(unittest.TestCase):
+    """Base class for tests that create Qt widgets"""
+
+    app: QApplication
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Share one QApplication between all tests, since Qt only allows one per process"""
+        # Any existing instance was created by another QtTestCase, so it is a QApplication
+        cls.app = cast(QApplication | None, QApplication.instance()) or QApplication(sys.argv)
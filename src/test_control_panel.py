@@ -0,0 +1,81 @@
+from PyQt6.QtCore import QEventLoop, Qt, QTimer
+from PyQt6.QtWidgets import QSlider
+
+from .control_panel import ControlPanel
+from .qt_test_case import QtTestCase
+
+
+class TestControlPanel(QtTestCase):
+    """Tests for control_panel.py"""
+
+    def create_panel(self, debounce_ms: int | None = None) -> tuple[ControlPanel, QSlider, list]:
+        """
+        Create a panel with one drag-free slider and one normal slider, recording the values it forwards
+
+        :param debounce_ms:
+        :return: the panel, its normal slider and the list of forwarded values
+        """
+        panel = ControlPanel(
+            "Test",
+            {
+                "sliders": [
+                    ("A", [], (0, 100), Qt.Orientation.Horizontal, True),
+                    ("B", [], (0, 100), Qt.Orientation.Horizontal, False),
+                ],
+                "description": "",
+            },
+            debounce_ms=debounce_ms,
+        )
+        forwarded = []
+        panel.sliderValueChanged.connect(lambda label, value: forwarded.append((label, value)))
+        return panel, panel.findChildren(QSlider)[1], forwarded
+
+    @staticmethod
+    def drag(slider: QSlider, values: range) -> None:
+        """
+        Drag a slider through some values and let go
+
+        :param slider:
+        :param values:
+        :return: None
+        """
+        slider.setSliderDown(True)
+        for value in values:
+            slider.setSliderPosition(value)
+        slider.setSliderDown(False)
+
+    def test_drag_forwards_final_value_once(self) -> None:
+        """
+        Test that dragging a slider forwards only the value it was let go at.
+
+        :return: None
+        """
+        panel, slider, forwarded = self.create_panel()
+        self.drag(slider, range(1, 10))
+        self.assertEqual(forwarded, [("B", 9)])
+
+    def test_steps_without_drag_are_forwarded(self) -> None:
+        """
+        Test that clicks and key presses, the only way to move a drag-free slider, still forward every value.
+
+        :return: None
+        """
+        panel, _, forwarded = self.create_panel()
+        drag_free_slider = panel.findChildren(QSlider)[0]
+        drag_free_slider.triggerAction(QSlider.SliderAction.SliderPageStepAdd)
+        drag_free_slider.triggerAction(QSlider.SliderAction.SliderPageStepAdd)
+        self.assertEqual(forwarded, [("A", 1), ("A", 2)])
+
+    def test_debounce_forwards_latest_value(self) -> None:
+        """
+        Test that with a debounce interval, a burst of changes is forwarded once the slider settles.
+
+        :return: None
+        """
+        panel, slider, forwarded = self.create_panel(debounce_ms=10)
+        self.drag(slider, range(1, 10))
+        self.assertEqual(forwarded, [])
+        loop = QEventLoop()
+        QTimer.singleShot(100, loop.quit)
+        loop.exec()
+        self.assertEqual(forwarded, [("B", 9)])
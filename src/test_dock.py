@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from .dock import Dock
+from .filter import apply_filter
+from .level import Level
+from .qt_test_case import QtTestCase
+
+
+class TestDock(QtTestCase):
+    """Tests for dock.py"""
+
+    def setUp(self) -> None:
+        """Create a dock for the motion level, with an image label to show its filter results in"""
+        self.level = Level(5)
+        self.image_display = QWidget()
+        self.img_label = QLabel()
+        self.img_label.resize(120, 90)
+        QVBoxLayout(self.image_display).addWidget(self.img_label)
+        self.dock = Dock(self.level, self.img_label, self.image_display, lambda code: None)
+        _, _, self.filter_args = self.level.filters[0]
+
+    def test_only_newest_filter_job_is_shown(self) -> None:
+        """
+        Test that a burst of slider changes only shows the image of the last one, as a pixmap on the GUI thread.
+
+        :return: None
+        """
+        with patch.object(self.dock, "update_image") as update_image:
+            for value in range(1, 6):
+                self.dock.update_args_and_image("Motion", "explode", value, self.filter_args)
+            self.dock._filter_pool.waitForDone()
+            self.app.processEvents()
+
+        update_image.assert_called_once()
+        pixmap = update_image.call_args.args[0]
+        self.assertIsInstance(pixmap, QPixmap)
+        self.assertFalse(pixmap.isNull())
+        expected = apply_filter("Motion", dict(self.dock.args_cache))
+        self.assertEqual(self.dock.args_cache["explode"], 5)
+        self.assertEqual(pixmap.toImage(), QPixmap.fromImage(expected).toImage())
@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from PyQt6.QtGui import QImage
+
+from .filter import apply_filter, clear_filter_cache
+
+
+class TestApplyFilter(unittest.TestCase):
+    """Tests for the memoized apply_filter in filter.py"""
+
+    def setUp(self) -> None:
+        """Start every test without images cached by other tests, and with a filter that records its calls"""
+        clear_filter_cache()
+        self.addCleanup(clear_filter_cache)
+        self.filter_function = MagicMock(side_effect=lambda *args: QImage(4, 3, QImage.Format.Format_RGB888))
+        patcher = patch("src.filter._load_filter", return_value=self.filter_function)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.args = {"image_to_edit": "image.png", "second_image": "second.png", "Exposure": 7}
+
+    def test_repeated_call_returns_cached_image(self) -> None:
+        """
+        Test that applying a filter again with the same arguments returns the same image without filtering again.
+
+        :return: None
+        """
+        first = apply_filter("Double Exposure", dict(self.args))
+        second = apply_filter("Double Exposure", dict(self.args))
+        self.assertIs(second, first)
+        self.filter_function.assert_called_once_with("image.png", "second.png", 7, 0, 0)
+        apply_filter("Double Exposure", {**self.args, "Exposure": 8})
+        self.assertEqual(self.filter_function.call_count, 2)
+
+    def test_clear_filter_cache_recomputes(self) -> None:
+        """
+        Test that clearing the cache makes the next call with the same arguments filter again.
+
+        :return: None
+        """
+        first = apply_filter("Double Exposure", dict(self.args))
+        clear_filter_cache()
+        second = apply_filter("Double Exposure", dict(self.args))
+        self.assertIsNot(second, first)
+        self.assertEqual(self.filter_function.call_count, 2)
@@ -0,0 +1,43 @@
+from .control_panel import ControlPanel
+from .level import Level
+from .qt_test_case import QtTestCase
+
+
+class TestLevel(QtTestCase):
+    """Tests for level.py"""
+
+    def test_levels_have_answer_image_and_panel(self) -> None:
+        """
+        Test that every level has a secret answer, an existing image and one control panel.
+
+        :return: None
+        """
+        for level_number in range(1, 6):
+            level = Level(level_number)
+            self.assertTrue(level.secret_answer, level_number)
+            self.assertTrue(level.img_source.is_file(), level_number)
+            self.assertEqual(len(level.filters), 1, level_number)
+            self.assertIsInstance(level.filters[0][1], ControlPanel)
+
+    def test_unknown_level_has_no_filters(self) -> None:
+        """
+        Test that a level past the last one falls back to the default answer and has no filters.
+
+        :return: None
+        """
+        level = Level(6)
+        self.assertEqual(level.secret_answer, "pythoncodejam2023")
+        self.assertEqual(level.filters, [])
+
+    def test_level_up(self) -> None:
+        """
+        Test that levelling up switches to the answer, image and filters of the next level.
+
+        :return: None
+        """
+        level = Level(1)
+        level.level_up()
+        self.assertEqual(level.level_number, 2)
+        self.assertEqual(level.secret_answer, Level(2).secret_answer)
+        self.assertEqual(level.img_source, Level(2).img_source)
+        self.assertEqual(level.filters[0][1].title, "Double Exposure")
@@ -1,18 +1,18 @@
 from pathlib import Path
 
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QImage
 
 from lib.hidden_in_ascii.hidden_in_ascii import (
     ascii_to_img, generate_ascii_file, prepare_input, seed_secret
 )
 
 
-def apply_ascii_art(args: dict) -> QPixmap:
+def apply_ascii_art(args: dict) -> QImage:
     """
     Apply ASCII art to the given image
 
     :param args: a dictionary of arguments
-    :return: QPixmap of the image
+    :return: QImage of the image
     """
     try:
         image_dir_path = Path(Path(__file__).parent.parent, "images")
@@ -22,8 +22,8 @@ def apply_ascii_art(args: dict) -> QPixmap:
         generate_ascii_file(input_img, ascii_file_path, 2)
         seed_secret(ascii_file_path, str(args.get("secret")), False)
         ascii_to_img(ascii_file_path, coordinates, input_img.size, output_img_path)
-        pixmap = QPixmap(str(output_img_path))
-        return pixmap
+        image = QImage(str(output_img_path))
+        return image
     except Exception as e:
         print(e)
-        return QPixmap()
+        return QImage()
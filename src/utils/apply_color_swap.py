@@ -1,14 +1,16 @@
 # Now integrate the LRUCache into your previous function:
+import numpy as np
 from PIL import Image
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtGui import QImage
 
 from lib.pixelate_and_swap.pixelate_and_swap import swap_colors
 from src.utils.apply_double_exposure import LRUCachePIL
+from src.utils.qimage_conversion import ndarray_to_qimage
 
 _image_cache = LRUCachePIL(capacity=10)  # Cache capacity of 10 images
 
 
-def apply_color_swap(image: tuple, first_color: str, second_color: str, w: int, h: int) -> QPixmap:
+def apply_color_swap(image: tuple, first_color: str, second_color: str, w: int, h: int) -> QImage:
     """
     Apply color swap to an image
 
@@ -17,7 +19,7 @@ def apply_color_swap(image: tuple, first_color: str, second_color: str, w: int,
     :param second_color:
     :param w: width of the image label
     :param h: height of the image label
-    :return: QPixmap
+    :return: QImage
     """
     colors = {
         "Rust": (164, 43, 17),
@@ -40,10 +42,5 @@ def apply_color_swap(image: tuple, first_color: str, second_color: str, w: int,
     # Apply color swap
     swapped_image = swap_colors(img, first_color_tuple, second_color_tuple)
 
-    # Convert swapped PIL image to QPixmap
-    swapped_image = swapped_image.convert("RGBA")
-    data = swapped_image.tobytes("raw", "BGRA")
-    qim = QImage(data, swapped_image.size[0], swapped_image.size[1], QImage.Format.Format_ARGB32)
-    pixmap = QPixmap.fromImage(qim)
-    pixmap = pixmap.scaled(w, h)
-    return pixmap
+    # Hand the swapped RGB pixels to Qt as they are, without adding alpha or swapping channels
+    return ndarray_to_qimage(np.asarray(swapped_image), w, h)
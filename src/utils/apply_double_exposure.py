@@ -1,15 +1,24 @@
+from functools import partial
+
+import cv2
 import numpy as np
 from PIL import Image
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtGui import QImage
 
-from lib.double_exposure.double_exposure import double_exposure
+from lib.double_exposure.double_exposure import (
+    blend_arrays, blend_arrays_opencl
+)
 from src.utils.lru_cache_pil import LRUCachePIL
+from src.utils.qimage_conversion import ndarray_to_qimage
+from src.utils.tiled_apply import tiled_apply
 
 # Create a cache for storing images:
 _image_cache = LRUCachePIL(capacity=10)  # Cache capacity of 10 images
+# Images smaller than this blend faster on the CPU than they take to copy to a GPU and back
+_OPENCL_MIN_BYTES = 8_000_000
 
 
-def apply_double_exposure(img1: tuple, img2: tuple, slider_value: int, w: int, h: int) -> QPixmap:
+def apply_double_exposure(img1: tuple, img2: tuple, slider_value: int, w: int, h: int) -> QImage:
     """
     Apply double exposure to an image
 
@@ -35,14 +44,13 @@ def apply_double_exposure(img1: tuple, img2: tuple, slider_value: int, w: int, h
     # Convert slider value to float between 0 and 1
     adjusted_slider_value = float(slider_value * 5) / 100
 
-    # Apply double exposure
-    blended_image = double_exposure(img1, img2, adjusted_slider_value)
-
-    # Convert blended image to QPixmap
-    image_np = np.array(blended_image)
-    height, width, channel = image_np.shape
-    bytesPerLine = 3 * width
-    qimage = QImage(image_np.data, width, height, bytesPerLine, QImage.Format.Format_RGB888)
-    pixmap = QPixmap.fromImage(qimage)
-    pixmap = pixmap.scaled(w, h)
-    return pixmap
+    # Apply double exposure, on a GPU for large images and otherwise one tile at a time
+    array1 = np.asarray(img1.convert("RGB"))
+    array2 = np.asarray(img2.convert("RGB").resize(img1.size))
+    if array1.nbytes > _OPENCL_MIN_BYTES and cv2.ocl.haveOpenCL():
+        blended = blend_arrays_opencl(array1, array2, adjusted_slider_value)
+    else:
+        blended = tiled_apply(partial(blend_arrays, alpha=adjusted_slider_value), (array1, array2))
+
+    # Convert blended image to QImage
+    return ndarray_to_qimage(blended, w, h)
@@ -1,14 +1,16 @@
-from PyQt6.QtGui import QImage, QPixmap
+import numpy as np
+from PyQt6.QtGui import QImage
 
 from lib.motions.motions import MotionTransformer
+from src.utils.qimage_conversion import ndarray_to_qimage
 
 
-def apply_motion(args: dict) -> QPixmap:
+def apply_motion(args: dict) -> QImage:
     """
     Apply a motion to an image
 
     :param args: a dictionary of arguments
-    :return: QPixmap of the image
+    :return: QImage of the image
     """
     mt: MotionTransformer = args["MotionTransformer"]
     try:
@@ -21,12 +23,12 @@ def apply_motion(args: dict) -> QPixmap:
                 args.get("explode", 0),
             )
         )
-        image = image.convert("RGBA")
-        data = image.tobytes("raw", "BGRA")
-        qim = QImage(data, image.size[0], image.size[1], QImage.Format.Format_ARGB32)
-        pixmap = QPixmap.fromImage(qim)
-        pixmap = pixmap.scaled(args["image_label_w"], args["image_label_h"])
-        return pixmap
+        # Keep the transparency of images that have it, and give everything else plain RGB pixels
+        mode = "RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB"
+        if image.mode != mode:
+            image = image.convert(mode)
+        # Hand the pixels to Qt as they are, without swapping channels
+        return ndarray_to_qimage(np.asarray(image), args["image_label_w"], args["image_label_h"])
     except Exception as e:
         print(e)
-        return QPixmap()
+        return QImage()
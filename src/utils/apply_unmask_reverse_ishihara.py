@@ -1,19 +1,20 @@
 import cv2
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtGui import QImage
 
 from lib.reverse_ishihara.reverse_ishihara import unmask_reverse_ishihara
 from src.utils.lru_cache_cv2 import LRUCacheCV2
+from src.utils.qimage_conversion import ndarray_to_qimage
 
 # Create a cache for storing OpenCV images:
 _image_cache_cv2 = LRUCacheCV2(capacity=10)  # Cache capacity of 10 images
 
 
-def apply_unmask_reverse_ishihara(args: dict) -> QPixmap:
+def apply_unmask_reverse_ishihara(args: dict) -> QImage:
     """
     Apply unmask reverse Ishihara to an image
 
     :param args: dict
-    :return: QPixmap
+    :return: QImage
     """
     try:
         if "A" in args:
@@ -43,15 +44,7 @@ def apply_unmask_reverse_ishihara(args: dict) -> QPixmap:
         unmasked_image_rgb = cv2.cvtColor(unmasked_image, cv2.COLOR_BGR2RGB)
 
         # Convert the numpy array (OpenCV image) to a QImage
-        height, width, channel = unmasked_image_rgb.shape
-        bytes_per_line = 3 * width
-        q_image = QImage(unmasked_image_rgb.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-
-        # Convert the QImage to QPixmap
-        pixmap = QPixmap.fromImage(q_image)
-        resized_pixmap = pixmap.scaled(args["image_label_w"], args["image_label_h"])
-
-        return resized_pixmap
+        return ndarray_to_qimage(unmasked_image_rgb, args["image_label_w"], args["image_label_h"])
     except Exception as e:
         print(e)
-        return QPixmap()  # Return an empty QPixmap
+        return QImage()  # Return an empty QImage
@@ -0,0 +1,45 @@
+import numpy as np
+from numpy.typing import NDArray
+from PyQt6.QtGui import QImage
+
+# QImage formats with the same memory layout as uint8 arrays, by number of channels
+_QIMAGE_FORMATS = {
+    1: QImage.Format.Format_Grayscale8,
+    3: QImage.Format.Format_RGB888,
+    4: QImage.Format.Format_RGBA8888,
+}
+
+
+def ndarray_to_qimage(array: NDArray[np.uint8], w: int, h: int) -> QImage:
+    """
+    Hand a greyscale, RGB or RGBA array to Qt without converting its pixels, and scale it to the image label
+
+    :param array: the image as a height x width (x channels) uint8 array
+    :param w: width of the image label
+    :param h: height of the image label
+    :return: QImage
+    """
+    # Only copies if the rows are not laid out one after another already
+    array = np.ascontiguousarray(array, dtype=np.uint8)
+    height, width = array.shape[:2]
+    channels = array.shape[2] if array.ndim == 3 else 1
+    image = QImage(array.data, width, height, array.strides[0], _QIMAGE_FORMATS[channels])
+    return scale_qimage(image, w, h)
+
+
+def scale_qimage(image: QImage, w: int, h: int) -> QImage:
+    """
+    Scale an image to the image label, into an image that owns its pixels
+
+    Filters build their QImage on top of a NumPy or bytes buffer that is freed
+    when they return, so the scaled image must not share it.
+
+    :param image: the image
+    :param w: width of the image label
+    :param h: height of the image label
+    :return: QImage
+    """
+    if (image.width(), image.height()) == (w, h):
+        # scaled() returns the image itself when the size does not change
+        return image.copy()
+    return image.scaled(w, h)
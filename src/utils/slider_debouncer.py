@@ -0,0 +1,65 @@
+from functools import partial
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QSlider
+
+
+class SliderDebouncer(QObject):
+    """Forwards the values of sliders, either when a drag ends or once the sliders stop moving for a while"""
+
+    valueChanged = pyqtSignal(str, int)
+
+    def __init__(self, parent: QObject, debounce_ms: int | None = None) -> None:
+        """
+        Init
+
+        :param parent:
+        :param debounce_ms: if set, forward values while dragging, at most once per this many
+            milliseconds of quiet; otherwise forward only the value a drag ends on
+        """
+        super().__init__(parent)
+        # Latest value of every slider moved since the debounce timer last fired
+        self._pending_values: dict[str, int] = {}
+        self._timer: QTimer | None = None
+        if debounce_ms is not None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(debounce_ms)
+            self._timer.timeout.connect(self._forward_pending_values)
+
+    def add_slider(self, label: str, slider: QSlider) -> None:
+        """
+        Forward the values of a slider as valueChanged(label, value)
+
+        :param label:
+        :param slider:
+        :return: None
+        """
+        if self._timer is None:
+            # Every value starts a full image filter, so skip the steps of a drag
+            slider.setTracking(False)
+            slider.valueChanged.connect(partial(self.valueChanged.emit, label))
+        else:
+            slider.valueChanged.connect(partial(self._hold_value, label))
+
+    def _hold_value(self, label: str, value: int) -> None:
+        """
+        Hold back the value of a slider until it has stopped moving for the debounce interval
+
+        :param label:
+        :param value:
+        :return: None
+        """
+        assert self._timer is not None, "only sliders added with a debounce interval hold their values"
+        self._pending_values[label] = value
+        self._timer.start()
+
+    def _forward_pending_values(self) -> None:
+        """
+        Forward the latest value of every slider moved since the last forward
+
+        :return: None
+        """
+        pending_values, self._pending_values = self._pending_values, {}
+        for label, value in pending_values.items():
+            self.valueChanged.emit(label, value)
@@ -0,0 +1,43 @@
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from lib.motions.motions import MotionTransformer
+
+from .apply_motions import apply_motion
+
+
+class ApplyMotionTestCase(unittest.TestCase):
+    """Tests for apply_motions.py"""
+
+    def apply(self, image: Image.Image) -> np.ndarray:
+        """
+        Apply the motions of a solved puzzle to an image, and read back the pixels Qt shows
+
+        :param image:
+        :return: the pixels of the QImage as a height x width x channels array
+        """
+        args = {"MotionTransformer": MotionTransformer(image, "aaaaa"), "image_label_w": 8, "image_label_h": 6}
+        qimage = apply_motion(args)
+        channels = 4 if qimage.hasAlphaChannel() else 3
+        pixels = np.frombuffer(qimage.constBits().asstring(qimage.sizeInBytes()), dtype=np.uint8)
+        return pixels.reshape(qimage.height(), qimage.bytesPerLine())[:, : 8 * channels].reshape(6, 8, channels)
+
+    def test_alpha_is_kept(self) -> None:
+        """
+        Test that images with an alpha channel keep their transparency.
+
+        :return: None
+        """
+        rgba = np.random.default_rng(0).integers(0, 256, (6, 8, 4), dtype=np.uint8)
+        np.testing.assert_array_equal(self.apply(Image.fromarray(rgba)), rgba)
+
+    def test_images_without_alpha_are_rgb(self) -> None:
+        """
+        Test that images without transparency are shown as plain RGB.
+
+        :return: None
+        """
+        grey = np.random.default_rng(0).integers(0, 256, (6, 8), dtype=np.uint8)
+        np.testing.assert_array_equal(self.apply(Image.fromarray(grey)), np.dstack([grey] * 3))
@@ -0,0 +1,58 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from .tiled_apply import tiled_apply
+
+
+def box_blur(tile: np.ndarray) -> np.ndarray:
+    """
+    Blur with a 5x5 box, a filter that needs 2 pixels of its neighbours on every side
+
+    :param tile:
+    :return: the blurred tile
+    """
+    return cv2.blur(tile, (5, 5), borderType=cv2.BORDER_REFLECT)
+
+
+class TiledApplyTestCase(unittest.TestCase):
+    """Tests for tiled_apply.py"""
+
+    def setUp(self) -> None:
+        """Create two images whose size is not a multiple of the tile size"""
+        rng = np.random.default_rng(0)
+        self.image1 = rng.integers(0, 256, (70, 45, 3), dtype=np.uint8)
+        self.image2 = rng.integers(0, 256, (70, 45, 3), dtype=np.uint8)
+
+    def test_partial_tiles_match_whole_image(self) -> None:
+        """
+        Test that filtering tiles that do not evenly divide the image gives the same result as the whole image.
+
+        :return: None
+        """
+        def filter_tiles(tile1: np.ndarray, tile2: np.ndarray) -> np.ndarray:
+            return np.maximum(tile1, tile2)[..., 0]
+
+        result = tiled_apply(filter_tiles, (self.image1, self.image2), tile=(16, 20))
+        np.testing.assert_array_equal(result, filter_tiles(self.image1, self.image2))
+
+    def test_overlap_gives_neighbourhood_filters_their_neighbours(self) -> None:
+        """
+        Test that tiles with overlap give the same result as the whole image for a filter that reads neighbours.
+
+        :return: None
+        """
+        result = tiled_apply(box_blur, (self.image1,), tile=(16, 20), overlap=2)
+        np.testing.assert_array_equal(result, box_blur(self.image1))
+        without_overlap = tiled_apply(box_blur, (self.image1,), tile=(16, 20))
+        self.assertFalse(np.array_equal(without_overlap, box_blur(self.image1)))
+
+    def test_empty_image(self) -> None:
+        """
+        Test that an empty image gives an empty result instead of an error.
+
+        :return: None
+        """
+        result = tiled_apply(lambda tile: tile[..., 0], (np.zeros((0, 45, 3), dtype=np.uint8),))
+        self.assertEqual(result.shape, (0, 45))
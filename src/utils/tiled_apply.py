@@ -0,0 +1,75 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+# NumPy and OpenCV release the GIL while they work on a tile, so tiles run in parallel on threads
+_FILTER_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def tiled_apply(
+    func: Callable[..., NDArray],
+    arrays: Sequence[NDArray],
+    tile: tuple[int, int] = (512, 512),
+    overlap: int = 0,
+) -> NDArray:
+    """
+    Apply a filter to tiles of one or more images of the same size and stitch the results together
+
+    Each tile's working set fits in the CPU cache, and only one tile's temporaries
+    per thread exist at a time, instead of temporaries the size of the whole image.
+
+    :param func: the filter, taking a tile of every image and returning the filtered tile
+    :param arrays: the images as height x width (x channels) arrays
+    :param tile: the height and width of a tile
+    :param overlap: how many pixels of the neighbouring tiles the filter needs to see around each tile
+    :return: the filtered image
+    """
+    height, width = arrays[0].shape[:2]
+    tile_height, tile_width = tile
+    bounds = [
+        (top, left, min(top + tile_height, height), min(left + tile_width, width))
+        for top in range(0, height, tile_height)
+        for left in range(0, width, tile_width)
+    ]
+
+    def filter_tile(top: int, left: int, bottom: int, right: int) -> NDArray:
+        """
+        Apply the filter to a tile plus its overlap, cut off at the image edges, and crop the result to the tile
+
+        :param top:
+        :param left:
+        :param bottom:
+        :param right:
+        :return: the filtered tile
+        """
+        outer_top, outer_left = max(top - overlap, 0), max(left - overlap, 0)
+        outer_bottom, outer_right = min(bottom + overlap, height), min(right + overlap, width)
+        result = func(*(array[outer_top:outer_bottom, outer_left:outer_right] for array in arrays))
+        return result[top - outer_top:bottom - outer_top, left - outer_left:right - outer_left]
+
+    def store_tile(top: int, left: int, bottom: int, right: int) -> None:
+        """
+        Filter a tile straight into the output, which no other tile writes to
+
+        :param top:
+        :param left:
+        :param bottom:
+        :param right:
+        :return:
+        """
+        output[top:bottom, left:right] = filter_tile(top, left, bottom, right)
+
+    if not bounds:
+        # An empty image has no tile to tell the type of the output, so pass it through the filter whole
+        return func(*arrays)
+    # The first tile tells the shape and type of the output
+    first = filter_tile(*bounds[0])
+    output = np.empty((height, width, *first.shape[2:]), dtype=first.dtype)
+    top, left, bottom, right = bounds[0]
+    output[top:bottom, left:right] = first
+    # Wait for every tile, raising the first error any of them had
+    list(_FILTER_POOL.map(lambda tile_bounds: store_tile(*tile_bounds), bounds[1:]))
+    return output
@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.dock import Dock
+from src.filter import clear_filter_cache
 from src.level import Level
 
 
@@ -124,4 +125,5 @@ class Window(QMainWindow):
                 msg_box.exec()
 
                 self.level.level_up()
+                clear_filter_cache()
                 self._init_ui()